@@ -13,6 +13,7 @@ from __future__ import annotations
 import os
 import pickle
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
 from babel import localedata
@@ -315,6 +316,13 @@ class Locale:
         >>> Locale.parse('de_AT@euro')
         Locale('de', territory='AT', modifier='euro')
 
+        The resolution of an identifier string is cached, but every call still
+        returns a new `Locale` object, so modifying the result does not affect
+        later calls:
+
+        >>> Locale.parse('de_DE') is Locale.parse('de_DE')
+        False
+
         :param identifier: the locale identifier string
         :param sep: optional component separator
         :param resolve_likely_subtags: if this is specified then a locale will
@@ -352,6 +360,28 @@ class Locale:
         if not isinstance(identifier, str):
             raise TypeError(f"Unexpected value for identifier: {identifier!r}")
 
+        return cls(*cls._parse_parts(identifier, sep, resolve_likely_subtags))
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _parse_parts(
+        cls,
+        identifier: str,
+        sep: str,
+        resolve_likely_subtags: bool,
+    ) -> tuple[str, str | None, str | None, str | None, str | None]:
+        # Only the resolved identifier parts are cached; `Locale` objects are
+        # mutable, so `parse` builds a fresh one from them on every call.
+        locale = cls._resolve(identifier, sep, resolve_likely_subtags)
+        return locale.language, locale.territory, locale.script, locale.variant, locale.modifier
+
+    @classmethod
+    def _resolve(
+        cls,
+        identifier: str,
+        sep: str,
+        resolve_likely_subtags: bool,
+    ) -> Locale:
         parts = parse_locale(identifier, sep=sep)
         input_id = get_locale_identifier(parts)
 
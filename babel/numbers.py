@@ -24,7 +24,9 @@ import datetime
 import decimal
 import re
 import warnings
-from typing import Any, Literal, cast, overload
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, cast, overload
 
 from babel.core import Locale, default_locale, get_global
 from babel.localedata import LocaleDataDict
@@ -57,10 +59,16 @@ def list_currencies(locale: Locale | str | None = None) -> set[str]:
                    provided, returns the list of all currencies from all
                    locales.
     """
-    # Get locale-scoped currencies.
+    return set(_known_currencies(locale))
+
+
+def _known_currencies(locale: Locale | str | None = None) -> Mapping[str, Any]:
+    """Return the mapping of currency codes known to `locale`, or to all
+    locales if no locale is given.
+    """
     if locale:
-        return set(Locale.parse(locale).currencies)
-    return set(get_global('all_currencies'))
+        return Locale.parse(locale).currencies
+    return get_global('all_currencies')
 
 
 def validate_currency(currency: str, locale: Locale | str | None = None) -> None:
@@ -71,7 +79,7 @@ def validate_currency(currency: str, locale: Locale | str | None = None) -> None
 
     Raises a `UnknownCurrencyError` exception if the currency is unknown to Babel.
     """
-    if currency not in list_currencies(locale):
+    if currency not in _known_currencies(locale):
         raise UnknownCurrencyError(currency)
 
 
@@ -80,13 +88,11 @@ def is_currency(currency: str, locale: Locale | str | None = None) -> bool:
 
     This method always return a Boolean and never raise.
     """
-    if not currency or not isinstance(currency, str):
-        return False
-    try:
-        validate_currency(currency, locale)
-    except UnknownCurrencyError:
+    # All currency codes are three letters long (ISO 4217), so reject
+    # anything else before looking at the locale data.
+    if not currency or not isinstance(currency, str) or len(currency) != 3:
         return False
-    return True
+    return currency in _known_currencies(locale)
 
 
 def normalize_currency(currency: str, locale: Locale | str | None = None) -> str | None:
@@ -148,9 +154,15 @@ def get_currency_symbol(currency: str, locale: Locale | str | None = None) -> st
     :param locale: the `Locale` object or locale identifier.
                    Defaults to the system currency locale or numeric locale.
     """
-    return Locale.parse(locale or LC_MONETARY).currency_symbols.get(currency, currency)
+    return _get_currency_symbol(currency, Locale.parse(locale or LC_MONETARY))
 
 
+@lru_cache(maxsize=512)
+def _get_currency_symbol(currency: str, locale: Locale) -> str:
+    return locale.currency_symbols.get(currency, currency)
+
+
+@lru_cache(maxsize=512)
 def get_currency_precision(currency: str) -> int:
     """Return currency's precision.
 
@@ -281,7 +293,6 @@ def get_territory_currencies(
                             dictionary will have the keys ``'currency'``,
                             ``'from'``, ``'to'``, and ``'tender'``.
     """
-    currencies = get_global('territory_currencies')
     if start_date is None:
         start_date = datetime.date.today()
     elif isinstance(start_date, datetime.datetime):
@@ -291,8 +302,31 @@ def get_territory_currencies(
     elif isinstance(end_date, datetime.datetime):
         end_date = end_date.date()
 
-    curs = currencies.get(territory.upper(), ())
+    curs = _get_active_territory_currencies(territory.upper(), start_date, end_date, tender, non_tender)
+
+    if include_details:
+        return [
+            {
+                'currency': currency_code,
+                'from': start,
+                'to': end,
+                'tender': is_tender,
+            }
+            for currency_code, start, end, is_tender in curs
+        ]
+    return [currency_code for currency_code, _, _, _ in curs]
+
+
+@lru_cache(maxsize=1024)
+def _get_active_territory_currencies(
+    territory: str,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    tender: bool,
+    non_tender: bool,
+) -> tuple[tuple[str, datetime.date | None, datetime.date | None, bool], ...]:
     # TODO: validate that the territory exists
+    curs = get_global('territory_currencies').get(territory, ())
 
     def _is_active(start, end):
         return (start is None or start <= end_date) and \
@@ -306,17 +340,9 @@ def get_territory_currencies(
             end = datetime.date(*end)
         if ((is_tender and tender) or
                 (not is_tender and non_tender)) and _is_active(start, end):
-            if include_details:
-                result.append({
-                    'currency': currency_code,
-                    'from': start,
-                    'to': end,
-                    'tender': is_tender,
-                })
-            else:
-                result.append(currency_code)
+            result.append((currency_code, start, end, is_tender))
 
-    return result
+    return tuple(result)
 
 
 def _get_numbering_system(locale: Locale, numbering_system: Literal["default"] | str = "latn") -> str:
@@ -338,6 +364,30 @@ def _get_number_symbols(
         raise UnsupportedNumberingSystemError(f"Unknown numbering system {numbering_system} for Locale {locale}.") from error
 
 
+class _NumberSymbols(NamedTuple):
+    decimal: str
+    group: str
+    plus_sign: str
+    minus_sign: str
+    exponential: str
+    infinity: str
+
+
+@lru_cache(maxsize=256)
+def _get_number_symbol_bundle(locale: Locale, numbering_system: str) -> _NumberSymbols:
+    # Resolve the symbols used while formatting once per locale and
+    # numbering system, instead of walking the locale data on every call.
+    symbols = _get_number_symbols(locale, numbering_system=numbering_system)
+    return _NumberSymbols(
+        decimal=symbols.get('decimal', '.'),
+        group=symbols.get('group', ','),
+        plus_sign=symbols.get('plusSign', '+'),
+        minus_sign=symbols.get('minusSign', '-'),
+        exponential=symbols.get('exponential', 'E'),
+        infinity=symbols.get('infinity', '∞'),
+    )
+
+
 class UnsupportedNumberingSystemError(Exception):
     """Exception thrown when an unsupported numbering system is requested for the given Locale."""
     pass
@@ -363,7 +413,7 @@ def get_decimal_symbol(
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('decimal', '.')
+    return _get_number_symbol_bundle(locale, numbering_system).decimal
 
 
 def get_plus_sign_symbol(
@@ -386,7 +436,7 @@ def get_plus_sign_symbol(
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('plusSign', '+')
+    return _get_number_symbol_bundle(locale, numbering_system).plus_sign
 
 
 def get_minus_sign_symbol(
@@ -409,7 +459,7 @@ def get_minus_sign_symbol(
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('minusSign', '-')
+    return _get_number_symbol_bundle(locale, numbering_system).minus_sign
 
 
 def get_exponential_symbol(
@@ -432,7 +482,7 @@ def get_exponential_symbol(
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('exponential', 'E')
+    return _get_number_symbol_bundle(locale, numbering_system).exponential
 
 
 def get_group_symbol(
@@ -455,7 +505,7 @@ def get_group_symbol(
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('group', ',')
+    return _get_number_symbol_bundle(locale, numbering_system).group
 
 
 def get_infinity_symbol(
@@ -478,7 +528,7 @@ def get_infinity_symbol(
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
     locale = Locale.parse(locale or LC_NUMERIC)
-    return _get_number_symbols(locale, numbering_system=numbering_system).get('infinity', '∞')
+    return _get_number_symbol_bundle(locale, numbering_system).infinity
 
 
 def format_number(number: float | decimal.Decimal | str, locale: Locale | str | None = None) -> str:
@@ -519,6 +569,14 @@ def get_decimal_precision(number: decimal.Decimal) -> int:
 def get_decimal_quantum(precision: int | decimal.Decimal) -> decimal.Decimal:
     """Return minimal quantum of a number, as defined by precision."""
     assert isinstance(precision, (int, decimal.Decimal))
+    if isinstance(precision, int):
+        return _get_int_decimal_quantum(precision)
+    return decimal.Decimal(10) ** (-precision)
+
+
+@lru_cache(maxsize=128)
+def _get_int_decimal_quantum(precision: int) -> decimal.Decimal:
+    # Powers of ten are exact and immutable, so they can be shared.
     return decimal.Decimal(10) ** (-precision)
 
 
@@ -845,6 +903,10 @@ def _format_currency_long_name(
     return unit_pattern.format(number_part, display_name)
 
 
+_NON_CURRENCY_PLACEHOLDER_RE = re.compile(r'[^0\s\¤]')
+_ADJACENT_SPACES_RE = re.compile(r'(\s)\s+')
+
+
 def format_compact_currency(
     number: float | decimal.Decimal | str,
     currency: str,
@@ -887,9 +949,9 @@ def format_compact_currency(
             if '¤' not in format:
                 continue
             # remove characters that are not the currency symbol, 0's or spaces
-            format = re.sub(r'[^0\s\¤]', '', format)
+            format = _NON_CURRENCY_PLACEHOLDER_RE.sub('', format)
             # compress adjacent spaces into one
-            format = re.sub(r'(\s)\s+', r'\1', format).strip()
+            format = _ADJACENT_SPACES_RE.sub(r'\1', format).strip()
             break
     if format is None:
         raise ValueError('No compact currency format found for the given number and locale.')
@@ -1022,6 +1084,12 @@ SPACE_CHARS = {
 
 SPACE_CHARS_RE = re.compile('|'.join(SPACE_CHARS))
 
+# Translation tables folding every kind of space into the given grouping symbol.
+_SPACE_CHARS_TRANSLATIONS = {
+    symbol: str.maketrans(dict.fromkeys(SPACE_CHARS, symbol))
+    for symbol in SPACE_CHARS
+}
+
 
 def parse_number(
     string: str,
@@ -1055,11 +1123,11 @@ def parse_number(
 
     if (
         group_symbol in SPACE_CHARS and  # if the grouping symbol is a kind of space,
-        group_symbol not in string and  # and the string to be parsed does not contain it,
-        SPACE_CHARS_RE.search(string)  # but it does contain any other kind of space instead,
+        group_symbol not in string  # and the string to be parsed does not contain it,
     ):
-        # ... it's reasonable to assume it is taking the place of the grouping symbol.
-        string = SPACE_CHARS_RE.sub(group_symbol, string)
+        # ... any other kind of space is reasonably assumed to be taking the
+        # place of the grouping symbol.
+        string = string.translate(_SPACE_CHARS_TRANSLATIONS[group_symbol])
 
     try:
         return int(string.replace(group_symbol, ''))
@@ -1121,11 +1189,11 @@ def parse_decimal(
 
     if not strict and (
         group_symbol in SPACE_CHARS and  # if the grouping symbol is a kind of space,
-        group_symbol not in string and  # and the string to be parsed does not contain it,
-        SPACE_CHARS_RE.search(string)  # but it does contain any other kind of space instead,
+        group_symbol not in string  # and the string to be parsed does not contain it,
     ):
-        # ... it's reasonable to assume it is taking the place of the grouping symbol.
-        string = SPACE_CHARS_RE.sub(group_symbol, string)
+        # ... any other kind of space is reasonably assumed to be taking the
+        # place of the grouping symbol.
+        string = string.translate(_SPACE_CHARS_TRANSLATIONS[group_symbol])
 
     try:
         parsed = decimal.Decimal(string.replace(group_symbol, '')
@@ -1210,6 +1278,8 @@ SUFFIX_PATTERN = r"(?P<suffix>.*)"
 
 number_re = re.compile(f"{PREFIX_PATTERN}{NUMBER_PATTERN}{SUFFIX_PATTERN}")
 
+_QUOTED_LITERAL_RE = re.compile(r"'([^']*)'")
+
 
 def parse_grouping(p: str) -> tuple[int, int]:
     """Parse primary and secondary digit grouping
@@ -1233,17 +1303,38 @@ def parse_grouping(p: str) -> tuple[int, int]:
     return g1, g2
 
 
+def _match_number(pattern: str) -> tuple[str, str, str]:
+    rv = number_re.search(pattern)
+    if rv is None:
+        raise ValueError(f"Invalid number pattern {pattern!r}")
+    return rv.groups()
+
+
+def _parse_precision(p: str) -> tuple[int, int]:
+    """Calculate the min and max allowed digits"""
+    min = max = 0
+    for c in p:
+        if c in '@0':
+            min += 1
+            max += 1
+        elif c == '#':
+            max += 1
+        elif c == ',':
+            continue
+        else:
+            break
+    return min, max
+
+
 def parse_pattern(pattern: NumberPattern | str) -> NumberPattern:
     """Parse number format patterns"""
     if isinstance(pattern, NumberPattern):
         return pattern
+    return _cached_parse_pattern(pattern)
 
-    def _match_number(pattern):
-        rv = number_re.search(pattern)
-        if rv is None:
-            raise ValueError(f"Invalid number pattern {pattern!r}")
-        return rv.groups()
 
+@lru_cache(maxsize=1024)
+def _cached_parse_pattern(pattern: str) -> NumberPattern:
     pos_pattern = pattern
 
     # Do we have a negative subpattern?
@@ -1267,27 +1358,12 @@ def parse_pattern(pattern: NumberPattern | str) -> NumberPattern:
         integer = number
         fraction = ''
 
-    def parse_precision(p):
-        """Calculate the min and max allowed digits"""
-        min = max = 0
-        for c in p:
-            if c in '@0':
-                min += 1
-                max += 1
-            elif c == '#':
-                max += 1
-            elif c == ',':
-                continue
-            else:
-                break
-        return min, max
-
-    int_prec = parse_precision(integer)
-    frac_prec = parse_precision(fraction)
+    int_prec = _parse_precision(integer)
+    frac_prec = _parse_precision(fraction)
     if exp:
         exp_plus = exp.startswith('+')
         exp = exp.lstrip('+')
-        exp_prec = parse_precision(exp)
+        exp_prec = _parse_precision(exp)
     else:
         exp_plus = None
         exp_prec = None
@@ -1300,6 +1376,20 @@ def parse_pattern(pattern: NumberPattern | str) -> NumberPattern:
 
 class NumberPattern:
 
+    __slots__ = (
+        'pattern',
+        'prefix',
+        'suffix',
+        'number_pattern',
+        'grouping',
+        'int_prec',
+        'frac_prec',
+        'exp_prec',
+        'exp_plus',
+        'scale',
+        'significant',
+    )
+
     def __init__(
         self,
         pattern: str,
@@ -1323,10 +1413,22 @@ class NumberPattern:
         self.exp_prec = exp_prec
         self.exp_plus = exp_plus
         self.scale = self.compute_scale()
+        self.significant = '@' in pattern
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self.pattern!r}>"
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # The state is a plain attribute dict, which is also what patterns
+        # pickled before `__slots__` was introduced carry.
+        for name, value in state.items():
+            setattr(self, name, value)
+        if 'significant' not in state:
+            self.significant = '@' in self.pattern
+
     def compute_scale(self) -> Literal[0, 2, 3]:
         """Return the scaling factor to apply to the number before rendering.
 
@@ -1415,14 +1517,32 @@ class NumberPattern:
         :rtype: str
         :raise UnsupportedNumberingSystemError: If the numbering system is not supported by the locale.
         """
-        if not isinstance(value, decimal.Decimal):
-            value = decimal.Decimal(str(value))
+        int_value = None
+        if not self.exp_prec and not self.significant:
+            if type(value) is int:
+                int_value = value * 10 ** self.scale
+            elif type(value) is float and 0 < abs(value) < 2 ** 52 / 10 ** self.scale:
+                # Floats that are whole once scaled (1099.0, or 0.34 in a
+                # percent pattern) render just like the equivalent integer.
+                # Below the bound floats are spaced more finely than the
+                # scaled grid, so this check agrees with Decimal(str(value)).
+                scaled = round(value * 10 ** self.scale)
+                if scaled / 10 ** self.scale == value:
+                    int_value = scaled
+
+        if int_value is not None:
+            # Integers never need rounding, so skip the Decimal round-trip.
+            is_negative = int(int_value < 0)
+            value = abs(int_value)
+        else:
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(str(value))
 
-        value = value.scaleb(self.scale)
+            value = value.scaleb(self.scale)
 
-        # Separate the absolute value from its sign.
-        is_negative = int(value.is_signed())
-        value = abs(value).normalize()
+            # Separate the absolute value from its sign.
+            is_negative = int(value.is_signed())
+            value = abs(value).normalize()
 
         # Prepare scientific notation metadata.
         if self.exp_prec:
@@ -1449,7 +1569,9 @@ class NumberPattern:
         # notation pattern has a missing mandatory fractional part (as in the
         # default '#E0' pattern). This special case has been extensively
         # discussed at https://github.com/python-babel/babel/pull/494#issuecomment-307649969 .
-        if not decimal_quantization or (self.exp_prec and frac_prec == (0, 0)):
+        if isinstance(value, decimal.Decimal) and (
+            not decimal_quantization or (self.exp_prec and frac_prec == (0, 0))
+        ):
             frac_prec = (frac_prec[0], max([frac_prec[1], get_decimal_precision(value)]))
 
         # Render scientific notation.
@@ -1462,7 +1584,7 @@ class NumberPattern:
             ])
 
         # Is it a significant digits pattern?
-        elif '@' in self.pattern:
+        elif self.significant:
             text = self._format_significant(value,
                                             self.int_prec[0],
                                             self.int_prec[1])
@@ -1481,13 +1603,15 @@ class NumberPattern:
             self.suffix[is_negative]])
 
         if '¤' in retval and currency is not None:
-            retval = retval.replace('¤¤¤', get_currency_name(currency, value, locale))
+            if '¤¤¤' in retval:
+                retval = retval.replace('¤¤¤', get_currency_name(currency, value, locale))
             retval = retval.replace('¤¤', currency.upper())
             retval = retval.replace('¤', get_currency_symbol(currency, locale))
 
         # remove single quotes around text, except for doubled single quotes
         # which are replaced with a single quote
-        retval = re.sub(r"'([^']*)'", lambda m: m.group(1) or "'", retval)
+        if "'" in retval:
+            retval = _QUOTED_LITERAL_RE.sub(lambda m: m.group(1) or "'", retval)
 
         return retval
 
@@ -1543,29 +1667,40 @@ class NumberPattern:
         if width < min:
             value = '0' * (min - width) + value
         gsize = self.grouping[0]
-        ret = ''
         symbol = get_group_symbol(locale, numbering_system=numbering_system)
+        if len(value) <= gsize:
+            return value
+        if 0 < gsize == self.grouping[1]:
+            # Uniform grouping: slice the groups left to right in one pass.
+            head = len(value) % gsize or gsize
+            return symbol.join([value[:head]] + [value[i:i + gsize] for i in range(head, len(value), gsize)])
+        groups = []
         while len(value) > gsize:
-            ret = symbol + value[-gsize:] + ret
+            groups.append(value[-gsize:])
             value = value[:-gsize]
             gsize = self.grouping[1]
-        return value + ret
+        groups.append(value)
+        return symbol.join(reversed(groups))
 
     def _quantize_value(
         self,
-        value: decimal.Decimal,
+        value: decimal.Decimal | int,
         locale: Locale | str | None,
         frac_prec: tuple[int, int],
         group_separator: bool,
         *,
         numbering_system: Literal["default"] | str,
     ) -> str:
-        # If the number is +/-Infinity, we can't quantize it
-        if value.is_infinite():
-            return get_infinity_symbol(locale, numbering_system=numbering_system)
-        quantum = get_decimal_quantum(frac_prec[1])
-        rounded = value.quantize(quantum)
-        a, sep, b = f"{rounded:f}".partition(".")
+        if isinstance(value, int):
+            # Integers from the fast path in `apply` have no fractional part.
+            a, b = str(value), ''
+        else:
+            # If the number is +/-Infinity, we can't quantize it
+            if value.is_infinite():
+                return get_infinity_symbol(locale, numbering_system=numbering_system)
+            quantum = get_decimal_quantum(frac_prec[1])
+            rounded = value.quantize(quantum)
+            a, sep, b = f"{rounded:f}".partition(".")
         integer_part = a
         if group_separator:
             integer_part = self._format_int(a, self.int_prec[0], self.int_prec[1], locale, numbering_system=numbering_system)
@@ -12,6 +12,7 @@ from __future__ import annotations
 import decimal
 import re
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from typing import Any, Callable, Literal
 
 _plural_tags = ('zero', 'one', 'two', 'few', 'many', 'other')
@@ -65,12 +66,13 @@ def extract_operands(source: float | decimal.Decimal) -> tuple[decimal.Decimal |
         dec_tuple = n.as_tuple()
         exp = dec_tuple.exponent
         fraction_digits = dec_tuple.digits[exp:] if exp < 0 else ()
-        trailing = ''.join(str(d) for d in fraction_digits)
-        no_trailing = trailing.rstrip('0')
-        v = len(trailing)
-        w = len(no_trailing)
-        f = int(trailing or 0)
-        t = int(no_trailing or 0)
+        v = w = len(fraction_digits)
+        while w and not fraction_digits[w - 1]:
+            w -= 1
+        f = 0
+        for digit in fraction_digits:
+            f = f * 10 + digit
+        t = f // 10 ** (v - w)
     else:
         v = w = f = t = 0
     c = e = 0  # TODO: c and e are not supported
@@ -212,12 +214,6 @@ def to_python(rule: Mapping[str, str] | Iterable[tuple[str, str]] | PluralRule)
     :param rule: the rules as list or dict, or a `PluralRule` object
     :raise RuleError: if the expression is malformed
     """
-    namespace = {
-        'IN': in_range_list,
-        'WITHIN': within_range_list,
-        'MOD': cldr_modulo,
-        'extract_operands': extract_operands,
-    }
     to_python_func = _PythonCompiler().compile
     result = [
         'def evaluate(n):',
@@ -228,7 +224,19 @@ def to_python(rule: Mapping[str, str] | Iterable[tuple[str, str]] | PluralRule)
         # a limited ascii restricted set of tags anyways so that is fine.
         result.append(f" if ({to_python_func(ast)}): return {str(tag)!r}")
     result.append(f" return {_fallback_tag!r}")
-    code = compile('\n'.join(result), '<rule>', 'exec')
+    return _compile_python_rule('\n'.join(result))
+
+
+@lru_cache(maxsize=256)
+def _compile_python_rule(source: str) -> Callable[[float | decimal.Decimal], str]:
+    # Many locales share the same plural rules, so the generated source
+    # only needs to be compiled once.
+    namespace = {
+        'IN': in_range_list,
+        'WITHIN': within_range_list,
+        'extract_operands': extract_operands,
+    }
+    code = compile(source, '<rule>', 'exec')
     eval(code, namespace)
     return namespace['evaluate']
 
@@ -293,7 +301,10 @@ def within_range_list(num: float | decimal.Decimal, range_list: Iterable[Iterabl
     >>> within_range_list(10.5, [(1, 4), (20, 30)])
     False
     """
-    return any(min_ <= num <= max_ for min_, max_ in range_list)
+    for min_, max_ in range_list:
+        if min_ <= num <= max_:
+            return True
+    return False
 
 
 def cldr_modulo(a: float, b: float) -> float:
@@ -307,16 +318,8 @@ def cldr_modulo(a: float, b: float) -> float:
     >>> cldr_modulo(3, 5)
     3
     """
-    reverse = 0
-    if a < 0:
-        a *= -1
-        reverse = 1
-    if b < 0:
-        b *= -1
-    rv = a % b
-    if reverse:
-        rv *= -1
-    return rv
+    rv = abs(a) % abs(b)
+    return -rv if a < 0 else rv
 
 
 class RuleError(Exception):
@@ -336,28 +339,31 @@ _VARS = {
 
 _RULES: list[tuple[str | None, re.Pattern[str]]] = [
     (None, re.compile(r'\s+', re.UNICODE)),
-    ('word', re.compile(fr'\b(and|or|is|(?:with)?in|not|mod|[{"".join(_VARS)}])\b')),
+    ('word', re.compile(fr'\b(?:and|or|is|(?:with)?in|not|mod|[{"".join(_VARS)}])\b')),
     ('value', re.compile(r'\d+')),
     ('symbol', re.compile(r'%|,|!=|=')),
     ('ellipsis', re.compile(r'\.{2,3}|\u2026', re.UNICODE)),  # U+2026: ELLIPSIS
 ]
 
+# All token rules folded into one pattern; the alternatives keep the
+# priority order of `_RULES`, and whitespace is matched by the `skip` group.
+_TOKEN_RE = re.compile('|'.join(f"(?P<{tok or 'skip'}>{rule.pattern})" for tok, rule in _RULES))
+
 
 def tokenize_rule(s: str) -> list[tuple[str, str]]:
     s = s.split('@')[0]
     result: list[tuple[str, str]] = []
     pos = 0
     end = len(s)
+    match_token = _TOKEN_RE.match
     while pos < end:
-        for tok, rule in _RULES:
-            match = rule.match(s, pos)
-            if match is not None:
-                pos = match.end()
-                if tok:
-                    result.append((tok, match.group()))
-                break
-        else:
+        match = match_token(s, pos)
+        if match is None:
             raise RuleError(f"malformed CLDR pluralization rule.  Got unexpected {s[pos]!r}")
+        pos = match.end()
+        tok = match.lastgroup
+        if tok != 'skip':
+            result.append((tok, match.group()))
     return result[::-1]
 
 
@@ -557,15 +563,34 @@ class _Compiler:
         raise NotImplementedError()
 
 
+#: Integer ``in`` relations with at most this many members are compiled to
+#: a set membership test instead of a call to `in_range_list`.
+_MAX_IN_SET_SIZE = 128
+
+
 class _PythonCompiler(_Compiler):
     """Compiles an expression to Python."""
 
     compile_and = _binary_compiler('(%s and %s)')
     compile_or = _binary_compiler('(%s or %s)')
     compile_not = _unary_compiler('(not %s)')
-    compile_mod = _binary_compiler('MOD(%s, %s)')
+    # The operands are never negative (`n` is an absolute value), so the
+    # native `%` operator already has the CLDR truncating semantics.
+    compile_mod = _binary_compiler('(%s %% %s)')
 
     def compile_relation(self, method, expr, range_list):
+        if method == 'in':
+            bounds = [(a, b) for (_, (a,)), (_, (b,)) in range_list[1]]
+            # Count before expanding, so that wide ranges never get
+            # materialized; overlapping ranges only make this an upper bound.
+            if sum(b - a + 1 for a, b in bounds if b >= a) <= _MAX_IN_SET_SIZE:
+                members = set()
+                for a, b in bounds:
+                    members.update(range(a, b + 1))
+                # Python turns a constant set literal in a membership
+                # test into a frozenset constant, and hashing only matches
+                # whole numbers, exactly like `in_range_list`.
+                return f"({self.compile(expr)} in {{{', '.join(map(str, sorted(members)))}}})"
         ranges = ",".join([f"({self.compile(a)}, {self.compile(b)})" for (a, b) in range_list[1]])
         return f"{method.upper()}({self.compile(expr)}, [{ranges}])"
 
@@ -16,6 +16,7 @@ import re
 import textwrap
 import warnings
 from collections.abc import Generator, Iterable
+from functools import lru_cache
 from typing import IO, Any, TypeVar
 
 from babel import dates, localtime
@@ -172,15 +173,24 @@ def pathmatch(pattern: str, filename: str) -> bool:
     :param pattern: the glob pattern
     :param filename: the path name of the file to match against
     """
-    symbols = {
-        '?': '[^/]',
-        '?/': '[^/]/',
-        '*': '[^/]+',
-        '*/': '[^/]+/',
-        '**/': '(?:.+/)*?',
-        '**': '(?:.+/)*?[^/]+',
-    }
+    match = _compile_pathmatch_pattern(pattern).match(filename.replace(os.sep, "/"))
+    return match is not None
+
+
+_PATHMATCH_SYMBOLS = {
+    '?': '[^/]',
+    '?/': '[^/]/',
+    '*': '[^/]+',
+    '*/': '[^/]+/',
+    '**/': '(?:.+/)*?',
+    '**': '(?:.+/)*?[^/]+',
+}
 
+
+@lru_cache(maxsize=256)
+def _compile_pathmatch_pattern(pattern: str) -> re.Pattern[str]:
+    # Extraction matches every file against the same few mapping patterns,
+    # so translate each glob into a regular expression only once.
     if pattern.startswith('^'):
         buf = ['^']
         pattern = pattern[1:]
@@ -192,11 +202,10 @@ def pathmatch(pattern: str, filename: str) -> bool:
 
     for idx, part in enumerate(re.split('([?*]+/?)', pattern)):
         if idx % 2:
-            buf.append(symbols[part])
+            buf.append(_PATHMATCH_SYMBOLS[part])
         elif part:
             buf.append(re.escape(part))
-    match = re.match(f"{''.join(buf)}$", filename.replace(os.sep, "/"))
-    return match is not None
+    return re.compile(f"{''.join(buf)}$")
 
 
 class TextWrapper(textwrap.TextWrapper):
@@ -102,6 +102,14 @@ class TestLocaleClass:
         de_DE = Locale.parse(locale)
         assert (de_DE.language, de_DE.territory) == ('de', 'DE')
 
+    def test_parse_cached(self):
+        assert Locale.parse('de_DE') == Locale.parse('de_DE')
+        assert Locale.parse('de-DE', sep='-') == Locale.parse('de_DE')
+
+        l = Locale.parse('de_DE')
+        l.territory = 'AT'
+        assert Locale.parse('de_DE').territory == 'DE'
+
     def test_parse_likely_subtags(self):
         locale = Locale.parse('zh-TW', sep='-')
         assert locale.language == 'zh'
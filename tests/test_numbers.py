@@ -11,12 +11,13 @@
 # history and logs, available at https://github.com/python-babel/babel/commits/master/.
 
 import decimal
+import pickle
 import unittest
 from datetime import date
 
 import pytest
 
-from babel import localedata, numbers
+from babel import numbers
 from babel.numbers import (
     UnknownCurrencyError,
     get_currency_precision,
@@ -29,158 +30,190 @@ from babel.numbers import (
 )
 
 
-class FormatDecimalTestCase(unittest.TestCase):
-
-    def test_patterns(self):
-        assert numbers.format_decimal(12345, '##0', locale='en_US') == '12345'
-        assert numbers.format_decimal(6.5, '0.00', locale='sv') == '6,50'
-        assert numbers.format_decimal((10.0 ** 20), '#.00', locale='en_US') == '100000000000000000000.00'
-        # regression test for #183, fraction digits were not correctly cut
-        # if the input was a float value and the value had more than 7
-        # significant digits
-        assert numbers.format_decimal(12345678.051, '#,##0.00', locale='en_US') == '12,345,678.05'
-
-    def test_subpatterns(self):
-        assert numbers.format_decimal((- 12345), '#,##0.##;-#', locale='en_US') == '-12,345'
-        assert numbers.format_decimal((- 12345), '#,##0.##;(#)', locale='en_US') == '(12,345)'
-
-    def test_default_rounding(self):
-        """
-        Testing Round-Half-Even (Banker's rounding)
-
-        A '5' is rounded to the closest 'even' number
-        """
-        assert numbers.format_decimal(5.5, '0', locale='sv') == '6'
-        assert numbers.format_decimal(6.5, '0', locale='sv') == '6'
-        assert numbers.format_decimal(1.2325, locale='sv') == '1,232'
-        assert numbers.format_decimal(1.2335, locale='sv') == '1,234'
-
-    def test_significant_digits(self):
-        """Test significant digits patterns"""
-        assert numbers.format_decimal(123004, '@@', locale='en_US') == '120000'
-        assert numbers.format_decimal(1.12, '@', locale='sv') == '1'
-        assert numbers.format_decimal(1.1, '@@', locale='sv') == '1,1'
-        assert numbers.format_decimal(1.1, '@@@@@##', locale='sv') == '1,1000'
-        assert numbers.format_decimal(0.0001, '@@@', locale='sv') == '0,000100'
-        assert numbers.format_decimal(0.0001234, '@@@', locale='sv') == '0,000123'
-        assert numbers.format_decimal(0.0001234, '@@@#', locale='sv') == '0,0001234'
-        assert numbers.format_decimal(0.0001234, '@@@#', locale='sv') == '0,0001234'
-        assert numbers.format_decimal(0.12345, '@@@', locale='sv') == '0,123'
-        assert numbers.format_decimal(3.14159, '@@##', locale='sv') == '3,142'
-        assert numbers.format_decimal(1.23004, '@@##', locale='sv') == '1,23'
-        assert numbers.format_decimal(1230.04, '@@,@@', locale='en_US') == '12,30'
-        assert numbers.format_decimal(123.41, '@@##', locale='en_US') == '123.4'
-        assert numbers.format_decimal(1, '@@', locale='en_US') == '1.0'
-        assert numbers.format_decimal(0, '@', locale='en_US') == '0'
-        assert numbers.format_decimal(0.1, '@', locale='en_US') == '0.1'
-        assert numbers.format_decimal(0.1, '@#', locale='en_US') == '0.1'
-        assert numbers.format_decimal(0.1, '@@', locale='en_US') == '0.10'
-
-    def test_decimals(self):
-        """Test significant digits patterns"""
-        assert numbers.format_decimal(decimal.Decimal('1.2345'), '#.00', locale='en_US') == '1.23'
-        assert numbers.format_decimal(decimal.Decimal('1.2345000'), '#.00', locale='en_US') == '1.23'
-        assert numbers.format_decimal(decimal.Decimal('1.2345000'), '@@', locale='en_US') == '1.2'
-        assert numbers.format_decimal(decimal.Decimal('12345678901234567890.12345'), '#.00', locale='en_US') == '12345678901234567890.12'
-
-    def test_scientific_notation(self):
-        assert numbers.format_scientific(0.1, '#E0', locale='en_US') == '1E-1'
-        assert numbers.format_scientific(0.01, '#E0', locale='en_US') == '1E-2'
-        assert numbers.format_scientific(10, '#E0', locale='en_US') == '1E1'
-        assert numbers.format_scientific(1234, '0.###E0', locale='en_US') == '1.234E3'
-        assert numbers.format_scientific(1234, '0.#E0', locale='en_US') == '1.2E3'
-        # Exponent grouping
-        assert numbers.format_scientific(12345, '##0.####E0', locale='en_US') == '1.2345E4'
-        # Minimum number of int digits
-        assert numbers.format_scientific(12345, '00.###E0', locale='en_US') == '12.345E3'
-        assert numbers.format_scientific(-12345.6, '00.###E0', locale='en_US') == '-12.346E3'
-        assert numbers.format_scientific(-0.01234, '00.###E0', locale='en_US') == '-12.34E-3'
-        # Custom pattern suffix
-        assert numbers.format_scientific(123.45, '#.##E0 m/s', locale='en_US') == '1.23E2 m/s'
-        # Exponent patterns
-        assert numbers.format_scientific(123.45, '#.##E00 m/s', locale='en_US') == '1.23E02 m/s'
-        assert numbers.format_scientific(0.012345, '#.##E00 m/s', locale='en_US') == '1.23E-02 m/s'
-        assert numbers.format_scientific(decimal.Decimal('12345'), '#.##E+00 m/s', locale='en_US') == '1.23E+04 m/s'
-        # 0 (see ticket #99)
-        assert numbers.format_scientific(0, '#E0', locale='en_US') == '0E0'
-
-    def test_formatting_of_very_small_decimals(self):
-        # previously formatting very small decimals could lead to a type error
-        # because the Decimal->string conversion was too simple (see #214)
-        number = decimal.Decimal("7E-7")
-        assert numbers.format_decimal(number, format="@@@", locale='en_US') == '0.000000700'
-
-    def test_nan_and_infinity(self):
-        assert numbers.format_decimal(decimal.Decimal('Infinity'), locale='en_US') == '∞'
-        assert numbers.format_decimal(decimal.Decimal('-Infinity'), locale='en_US') == '-∞'
-        assert numbers.format_decimal(decimal.Decimal('NaN'), locale='en_US') == 'NaN'
-        assert numbers.format_compact_decimal(decimal.Decimal('Infinity'), locale='en_US', format_type="short") == '∞'
-        assert numbers.format_compact_decimal(decimal.Decimal('-Infinity'), locale='en_US', format_type="short") == '-∞'
-        assert numbers.format_compact_decimal(decimal.Decimal('NaN'), locale='en_US', format_type="short") == 'NaN'
-        assert numbers.format_currency(decimal.Decimal('Infinity'), 'USD', locale='en_US') == '$∞'
-        assert numbers.format_currency(decimal.Decimal('-Infinity'), 'USD', locale='en_US') == '-$∞'
-
-    def test_group_separator(self):
-        assert numbers.format_decimal(29567.12, locale='en_US', group_separator=False) == '29567.12'
-        assert numbers.format_decimal(29567.12, locale='fr_CA', group_separator=False) == '29567,12'
-        assert numbers.format_decimal(29567.12, locale='pt_BR', group_separator=False) == '29567,12'
-        assert numbers.format_currency(1099.98, 'USD', locale='en_US', group_separator=False) == '$1099.98'
-        assert numbers.format_currency(101299.98, 'EUR', locale='fr_CA', group_separator=False) == '101299,98\xa0€'
-        assert numbers.format_currency(101299.98, 'EUR', locale='en_US', group_separator=False, format_type='name') == '101299.98 euros'
-        assert numbers.format_percent(251234.1234, locale='sv_SE', group_separator=False) == '25123412\xa0%'
-
-        assert numbers.format_decimal(29567.12, locale='en_US', group_separator=True) == '29,567.12'
-        assert numbers.format_decimal(29567.12, locale='fr_CA', group_separator=True) == '29\xa0567,12'
-        assert numbers.format_decimal(29567.12, locale='pt_BR', group_separator=True) == '29.567,12'
-        assert numbers.format_currency(1099.98, 'USD', locale='en_US', group_separator=True) == '$1,099.98'
-        assert numbers.format_currency(101299.98, 'EUR', locale='fr_CA', group_separator=True) == '101\xa0299,98\xa0€'
-        assert numbers.format_currency(101299.98, 'EUR', locale='en_US', group_separator=True, format_type='name') == '101,299.98 euros'
-        assert numbers.format_percent(251234.1234, locale='sv_SE', group_separator=True) == '25\xa0123\xa0412\xa0%'
-
-    def test_compact(self):
-        assert numbers.format_compact_decimal(1, locale='en_US', format_type="short") == '1'
-        assert numbers.format_compact_decimal(999, locale='en_US', format_type="short") == '999'
-        assert numbers.format_compact_decimal(1000, locale='en_US', format_type="short") == '1K'
-        assert numbers.format_compact_decimal(9000, locale='en_US', format_type="short") == '9K'
-        assert numbers.format_compact_decimal(9123, locale='en_US', format_type="short", fraction_digits=2) == '9.12K'
-        assert numbers.format_compact_decimal(10000, locale='en_US', format_type="short") == '10K'
-        assert numbers.format_compact_decimal(10000, locale='en_US', format_type="short", fraction_digits=2) == '10K'
-        assert numbers.format_compact_decimal(1000000, locale='en_US', format_type="short") == '1M'
-        assert numbers.format_compact_decimal(9000999, locale='en_US', format_type="short") == '9M'
-        assert numbers.format_compact_decimal(9000900099, locale='en_US', format_type="short", fraction_digits=5) == '9.0009B'
-        assert numbers.format_compact_decimal(1, locale='en_US', format_type="long") == '1'
-        assert numbers.format_compact_decimal(999, locale='en_US', format_type="long") == '999'
-        assert numbers.format_compact_decimal(1000, locale='en_US', format_type="long") == '1 thousand'
-        assert numbers.format_compact_decimal(9000, locale='en_US', format_type="long") == '9 thousand'
-        assert numbers.format_compact_decimal(9000, locale='en_US', format_type="long", fraction_digits=2) == '9 thousand'
-        assert numbers.format_compact_decimal(10000, locale='en_US', format_type="long") == '10 thousand'
-        assert numbers.format_compact_decimal(10000, locale='en_US', format_type="long", fraction_digits=2) == '10 thousand'
-        assert numbers.format_compact_decimal(1000000, locale='en_US', format_type="long") == '1 million'
-        assert numbers.format_compact_decimal(9999999, locale='en_US', format_type="long") == '10 million'
-        assert numbers.format_compact_decimal(9999999999, locale='en_US', format_type="long", fraction_digits=5) == '10 billion'
-        assert numbers.format_compact_decimal(1, locale='ja_JP', format_type="short") == '1'
-        assert numbers.format_compact_decimal(999, locale='ja_JP', format_type="short") == '999'
-        assert numbers.format_compact_decimal(1000, locale='ja_JP', format_type="short") == '1000'
-        assert numbers.format_compact_decimal(9123, locale='ja_JP', format_type="short") == '9123'
-        assert numbers.format_compact_decimal(10000, locale='ja_JP', format_type="short") == '1万'
-        assert numbers.format_compact_decimal(1234567, locale='ja_JP', format_type="short") == '123万'
-        assert numbers.format_compact_decimal(-1, locale='en_US', format_type="short") == '-1'
-        assert numbers.format_compact_decimal(-1234, locale='en_US', format_type="short", fraction_digits=2) == '-1.23K'
-        assert numbers.format_compact_decimal(-123456789, format_type='short', locale='en_US') == '-123M'
-        assert numbers.format_compact_decimal(-123456789, format_type='long', locale='en_US') == '-123 million'
-        assert numbers.format_compact_decimal(2345678, locale='mk', format_type='long') == '2 милиони'
-        assert numbers.format_compact_decimal(21000000, locale='mk', format_type='long') == '21 милион'
-        assert numbers.format_compact_decimal(21345, locale="gv", format_type="short") == '21K'
-        assert numbers.format_compact_decimal(1000, locale='it', format_type='long') == 'mille'
-        assert numbers.format_compact_decimal(1234, locale='it', format_type='long') == '1 mila'
-        assert numbers.format_compact_decimal(1000, locale='fr', format_type='long') == 'mille'
-        assert numbers.format_compact_decimal(1234, locale='fr', format_type='long') == '1 millier'
-        assert numbers.format_compact_decimal(
-            12345, format_type="short", locale='ar_EG', fraction_digits=2, numbering_system='default',
-        ) == '12٫34\xa0ألف'
-        assert numbers.format_compact_decimal(
-            12345, format_type="short", locale='ar_EG', fraction_digits=2, numbering_system='latn',
-        ) == '12.34\xa0ألف'
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    (-12345, '#,##0.##;-#', 'en_US', '-12,345'),
+    (-12345, '#,##0.##;(#)', 'en_US', '(12,345)'),
+])
+def test_format_decimal_subpatterns(value, pattern, locale, expected):
+    assert numbers.format_decimal(value, pattern, locale=locale) == expected
+
+
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    # A '5' is rounded to the closest 'even' number (Banker's rounding)
+    (5.5, '0', 'sv', '6'),
+    (6.5, '0', 'sv', '6'),
+    (1.2325, None, 'sv', '1,232'),
+    (1.2335, None, 'sv', '1,234'),
+])
+def test_format_decimal_default_rounding(value, pattern, locale, expected):
+    assert numbers.format_decimal(value, pattern, locale=locale) == expected
+
+
+def test_format_decimal_float_rounding():
+    """
+    Floats are rounded from their shortest repr rather than from their
+    binary value, and follow the rounding mode of the active context
+    """
+    assert numbers.format_decimal(2.675, '0.00', locale='sv') == '2,68'
+    assert numbers.format_decimal(1.005, '0.00', locale='sv') == '1,00'
+    with decimal.localcontext() as ctx:
+        ctx.rounding = decimal.ROUND_HALF_UP
+        assert numbers.format_decimal(1.005, '0.00', locale='sv') == '1,01'
+        assert numbers.format_decimal(6.5, '0', locale='sv') == '7'
+
+
+def test_formatting_of_very_small_decimals():
+    # previously formatting very small decimals could lead to a type error
+    # because the Decimal->string conversion was too simple (see #214)
+    number = decimal.Decimal("7E-7")
+    assert numbers.format_decimal(number, format="@@@", locale='en_US') == '0.000000700'
+
+
+def test_format_nan_and_infinity():
+    assert numbers.format_decimal(decimal.Decimal('Infinity'), locale='en_US') == '∞'
+    assert numbers.format_decimal(decimal.Decimal('-Infinity'), locale='en_US') == '-∞'
+    assert numbers.format_decimal(decimal.Decimal('NaN'), locale='en_US') == 'NaN'
+    assert numbers.format_compact_decimal(decimal.Decimal('Infinity'), locale='en_US', format_type="short") == '∞'
+    assert numbers.format_compact_decimal(decimal.Decimal('-Infinity'), locale='en_US', format_type="short") == '-∞'
+    assert numbers.format_compact_decimal(decimal.Decimal('NaN'), locale='en_US', format_type="short") == 'NaN'
+    assert numbers.format_currency(decimal.Decimal('Infinity'), 'USD', locale='en_US') == '$∞'
+    assert numbers.format_currency(decimal.Decimal('-Infinity'), 'USD', locale='en_US') == '-$∞'
+
+
+def test_format_group_separator():
+    assert numbers.format_decimal(29567.12, locale='en_US', group_separator=False) == '29567.12'
+    assert numbers.format_decimal(29567.12, locale='fr_CA', group_separator=False) == '29567,12'
+    assert numbers.format_decimal(29567.12, locale='pt_BR', group_separator=False) == '29567,12'
+    assert numbers.format_currency(1099.98, 'USD', locale='en_US', group_separator=False) == '$1099.98'
+    assert numbers.format_currency(101299.98, 'EUR', locale='fr_CA', group_separator=False) == '101299,98\xa0€'
+    assert numbers.format_currency(101299.98, 'EUR', locale='en_US', group_separator=False, format_type='name') == '101299.98 euros'
+    assert numbers.format_percent(251234.1234, locale='sv_SE', group_separator=False) == '25123412\xa0%'
+
+    assert numbers.format_decimal(29567.12, locale='en_US', group_separator=True) == '29,567.12'
+    assert numbers.format_decimal(29567.12, locale='fr_CA', group_separator=True) == '29\xa0567,12'
+    assert numbers.format_decimal(29567.12, locale='pt_BR', group_separator=True) == '29.567,12'
+    assert numbers.format_currency(1099.98, 'USD', locale='en_US', group_separator=True) == '$1,099.98'
+    assert numbers.format_currency(101299.98, 'EUR', locale='fr_CA', group_separator=True) == '101\xa0299,98\xa0€'
+    assert numbers.format_currency(101299.98, 'EUR', locale='en_US', group_separator=True, format_type='name') == '101,299.98 euros'
+    assert numbers.format_percent(251234.1234, locale='sv_SE', group_separator=True) == '25\xa0123\xa0412\xa0%'
+
+
+def test_format_compact_decimal():
+    assert numbers.format_compact_decimal(1, locale='en_US', format_type="short") == '1'
+    assert numbers.format_compact_decimal(999, locale='en_US', format_type="short") == '999'
+    assert numbers.format_compact_decimal(1000, locale='en_US', format_type="short") == '1K'
+    assert numbers.format_compact_decimal(9000, locale='en_US', format_type="short") == '9K'
+    assert numbers.format_compact_decimal(9123, locale='en_US', format_type="short", fraction_digits=2) == '9.12K'
+    assert numbers.format_compact_decimal(10000, locale='en_US', format_type="short") == '10K'
+    assert numbers.format_compact_decimal(10000, locale='en_US', format_type="short", fraction_digits=2) == '10K'
+    assert numbers.format_compact_decimal(1000000, locale='en_US', format_type="short") == '1M'
+    assert numbers.format_compact_decimal(9000999, locale='en_US', format_type="short") == '9M'
+    assert numbers.format_compact_decimal(9000900099, locale='en_US', format_type="short", fraction_digits=5) == '9.0009B'
+    assert numbers.format_compact_decimal(1, locale='en_US', format_type="long") == '1'
+    assert numbers.format_compact_decimal(999, locale='en_US', format_type="long") == '999'
+    assert numbers.format_compact_decimal(1000, locale='en_US', format_type="long") == '1 thousand'
+    assert numbers.format_compact_decimal(9000, locale='en_US', format_type="long") == '9 thousand'
+    assert numbers.format_compact_decimal(9000, locale='en_US', format_type="long", fraction_digits=2) == '9 thousand'
+    assert numbers.format_compact_decimal(10000, locale='en_US', format_type="long") == '10 thousand'
+    assert numbers.format_compact_decimal(10000, locale='en_US', format_type="long", fraction_digits=2) == '10 thousand'
+    assert numbers.format_compact_decimal(1000000, locale='en_US', format_type="long") == '1 million'
+    assert numbers.format_compact_decimal(9999999, locale='en_US', format_type="long") == '10 million'
+    assert numbers.format_compact_decimal(9999999999, locale='en_US', format_type="long", fraction_digits=5) == '10 billion'
+    assert numbers.format_compact_decimal(1, locale='ja_JP', format_type="short") == '1'
+    assert numbers.format_compact_decimal(999, locale='ja_JP', format_type="short") == '999'
+    assert numbers.format_compact_decimal(1000, locale='ja_JP', format_type="short") == '1000'
+    assert numbers.format_compact_decimal(9123, locale='ja_JP', format_type="short") == '9123'
+    assert numbers.format_compact_decimal(10000, locale='ja_JP', format_type="short") == '1万'
+    assert numbers.format_compact_decimal(1234567, locale='ja_JP', format_type="short") == '123万'
+    assert numbers.format_compact_decimal(-1, locale='en_US', format_type="short") == '-1'
+    assert numbers.format_compact_decimal(-1234, locale='en_US', format_type="short", fraction_digits=2) == '-1.23K'
+    assert numbers.format_compact_decimal(-123456789, format_type='short', locale='en_US') == '-123M'
+    assert numbers.format_compact_decimal(-123456789, format_type='long', locale='en_US') == '-123 million'
+    assert numbers.format_compact_decimal(2345678, locale='mk', format_type='long') == '2 милиони'
+    assert numbers.format_compact_decimal(21000000, locale='mk', format_type='long') == '21 милион'
+    assert numbers.format_compact_decimal(21345, locale="gv", format_type="short") == '21K'
+    assert numbers.format_compact_decimal(1000, locale='it', format_type='long') == 'mille'
+    assert numbers.format_compact_decimal(1234, locale='it', format_type='long') == '1 mila'
+    assert numbers.format_compact_decimal(1000, locale='fr', format_type='long') == 'mille'
+    assert numbers.format_compact_decimal(1234, locale='fr', format_type='long') == '1 millier'
+    assert numbers.format_compact_decimal(
+        12345, format_type="short", locale='ar_EG', fraction_digits=2, numbering_system='default',
+    ) == '12٫34\xa0ألف'
+    assert numbers.format_compact_decimal(
+        12345, format_type="short", locale='ar_EG', fraction_digits=2, numbering_system='latn',
+    ) == '12.34\xa0ألف'
+
+
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    (12345, '##0', 'en_US', '12345'),
+    (6.5, '0.00', 'sv', '6,50'),
+    (10.0 ** 20, '#.00', 'en_US', '100000000000000000000.00'),
+    # regression test for #183, fraction digits were not correctly cut
+    # if the input was a float value and the value had more than 7
+    # significant digits
+    (12345678.051, '#,##0.00', 'en_US', '12,345,678.05'),
+])
+def test_format_decimal_patterns(value, pattern, locale, expected):
+    assert numbers.format_decimal(value, pattern, locale=locale) == expected
+
+
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    (123004, '@@', 'en_US', '120000'),
+    (1.12, '@', 'sv', '1'),
+    (1.1, '@@', 'sv', '1,1'),
+    (1.1, '@@@@@##', 'sv', '1,1000'),
+    (0.0001, '@@@', 'sv', '0,000100'),
+    (0.0001234, '@@@', 'sv', '0,000123'),
+    (0.0001234, '@@@#', 'sv', '0,0001234'),
+    (0.12345, '@@@', 'sv', '0,123'),
+    (3.14159, '@@##', 'sv', '3,142'),
+    (1.23004, '@@##', 'sv', '1,23'),
+    (1230.04, '@@,@@', 'en_US', '12,30'),
+    (123.41, '@@##', 'en_US', '123.4'),
+    (1, '@@', 'en_US', '1.0'),
+    (0, '@', 'en_US', '0'),
+    (0.1, '@', 'en_US', '0.1'),
+    (0.1, '@#', 'en_US', '0.1'),
+    (0.1, '@@', 'en_US', '0.10'),
+])
+def test_format_decimal_significant_digits(value, pattern, locale, expected):
+    assert numbers.format_decimal(value, pattern, locale=locale) == expected
+
+
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    (decimal.Decimal('1.2345'), '#.00', 'en_US', '1.23'),
+    (decimal.Decimal('1.2345000'), '#.00', 'en_US', '1.23'),
+    (decimal.Decimal('1.2345000'), '@@', 'en_US', '1.2'),
+    (decimal.Decimal('12345678901234567890.12345'), '#.00', 'en_US', '12345678901234567890.12'),
+])
+def test_format_decimal_decimals(value, pattern, locale, expected):
+    assert numbers.format_decimal(value, pattern, locale=locale) == expected
+
+
+@pytest.mark.parametrize('value, pattern, locale, expected', [
+    (0.1, '#E0', 'en_US', '1E-1'),
+    (0.01, '#E0', 'en_US', '1E-2'),
+    (10, '#E0', 'en_US', '1E1'),
+    (1234, '0.###E0', 'en_US', '1.234E3'),
+    (1234, '0.#E0', 'en_US', '1.2E3'),
+    # Exponent grouping
+    (12345, '##0.####E0', 'en_US', '1.2345E4'),
+    # Minimum number of int digits
+    (12345, '00.###E0', 'en_US', '12.345E3'),
+    (-12345.6, '00.###E0', 'en_US', '-12.346E3'),
+    (-0.01234, '00.###E0', 'en_US', '-12.34E-3'),
+    # Custom pattern suffix
+    (123.45, '#.##E0 m/s', 'en_US', '1.23E2 m/s'),
+    # Exponent patterns
+    (123.45, '#.##E00 m/s', 'en_US', '1.23E02 m/s'),
+    (0.012345, '#.##E00 m/s', 'en_US', '1.23E-02 m/s'),
+    (decimal.Decimal('12345'), '#.##E+00 m/s', 'en_US', '1.23E+04 m/s'),
+    # 0 (see ticket #99)
+    (0, '#E0', 'en_US', '0E0'),
+])
+def test_format_scientific_notation(value, pattern, locale, expected):
+    assert numbers.format_scientific(value, pattern, locale=locale) == expected
+
 
 
 class NumberParsingTestCase(unittest.TestCase):
@@ -238,19 +271,20 @@ class NumberParsingTestCase(unittest.TestCase):
 
 
 def test_list_currencies():
-    assert isinstance(list_currencies(), set)
-    assert list_currencies().issuperset(['BAD', 'BAM', 'KRO'])
+    all_currencies = list_currencies()
+    assert isinstance(all_currencies, set)
+    assert all_currencies.issuperset({'BAD', 'BAM', 'KRO'})
+    assert len(all_currencies) == 307
 
-    assert isinstance(list_currencies(locale='fr'), set)
-    assert list_currencies('fr').issuperset(['BAD', 'BAM', 'KRO'])
+    fr_currencies = list_currencies(locale='fr')
+    assert isinstance(fr_currencies, set)
+    assert fr_currencies.issuperset({'BAD', 'BAM', 'KRO'})
 
     with pytest.raises(ValueError, match="expected only letters, got 'yo!'"):
         list_currencies('yo!')
 
     assert list_currencies(locale='pa_Arab') == {'PKR', 'INR', 'EUR'}
 
-    assert len(list_currencies()) == 307
-
 
 def test_validate_currency():
     validate_currency('EUR')
@@ -266,6 +300,7 @@ def test_is_currency():
     assert not is_currency('')
     assert not is_currency(None)
     assert not is_currency('   EUR    ')
+    assert not is_currency('EURO')
     assert not is_currency('   ')
     assert not is_currency([])
     assert not is_currency(set())
@@ -328,6 +363,11 @@ def test_get_territory_currencies():
 
     assert numbers.get_territory_currencies('QO', date(2013, 1, 1)) == []
 
+    # Lookups are cached, but callers always get a list of their own
+    currencies = numbers.get_territory_currencies('AT', date(2011, 1, 1))
+    currencies.append('XXX')
+    assert numbers.get_territory_currencies('AT', date(2011, 1, 1)) == ['EUR']
+
     # Croatia uses Euro starting in January 2023; this is in CLDR 42.
     # See https://github.com/python-babel/babel/issues/942
     assert 'EUR' in numbers.get_territory_currencies('HR', date(2023, 1, 1))
@@ -412,6 +452,10 @@ def test_format_decimal():
     assert numbers.format_decimal(-0001.2346000, locale='en_US') == '-1.235'
     assert numbers.format_decimal(0000000.5, locale='en_US') == '0.5'
     assert numbers.format_decimal(000, locale='en_US') == '0'
+    assert numbers.format_decimal(-1099, locale='en_US') == '-1,099'
+    assert numbers.format_decimal(2 ** 70, locale='en_US') == '1,180,591,620,717,411,303,424'
+    assert numbers.format_decimal(-1099.0, locale='en_US') == '-1,099'
+    assert numbers.format_decimal(-0.0, locale='en_US') == '-0'
 
     assert numbers.format_decimal(12345.5, locale='ar_EG') == '12,345.5'
     assert numbers.format_decimal(12345.5, locale='ar_EG', numbering_system="default") == '12٬345٫5'
@@ -419,6 +463,8 @@ def test_format_decimal():
 
     with pytest.raises(numbers.UnsupportedNumberingSystemError):
         numbers.format_decimal(12345.5, locale='en_US', numbering_system="unknown")
+    with pytest.raises(numbers.UnsupportedNumberingSystemError):
+        numbers.format_decimal(5, locale='en_US', numbering_system="unknown")
 
 
 @pytest.mark.parametrize('input_value, expected_value', [
@@ -449,11 +495,10 @@ def test_format_decimal_precision(input_value, expected_value):
         decimal.Decimal(input_value), locale='en_US', decimal_quantization=False) == expected_value
 
 
-def test_format_decimal_quantization():
-    # Test all locales.
-    for locale_code in localedata.locale_identifiers():
-        assert numbers.format_decimal(
-            '0.9999999999', locale=locale_code, decimal_quantization=False).endswith('9999999999') is True
+@pytest.mark.all_locales
+def test_format_decimal_quantization(locale):
+    assert numbers.format_decimal(
+        '0.9999999999', locale=locale, decimal_quantization=False).endswith('9999999999') is True
 
 
 def test_format_currency():
@@ -569,11 +614,10 @@ def test_format_currency_precision(input_value, expected_value):
     ) == expected_value
 
 
-def test_format_currency_quantization():
-    # Test all locales.
-    for locale_code in localedata.locale_identifiers():
-        assert numbers.format_currency(
-            '0.9999999999', 'USD', locale=locale_code, decimal_quantization=False).find('9999999999') > -1
+@pytest.mark.all_locales
+def test_format_currency_quantization(locale):
+    assert numbers.format_currency(
+        '0.9999999999', 'USD', locale=locale, decimal_quantization=False).find('9999999999') > -1
 
 
 def test_format_currency_long_display_name():
@@ -610,12 +654,12 @@ def test_format_currency_long_display_name():
             == '100,00 de dolari americani')
 
 
-def test_format_currency_long_display_name_all():
-    for locale_code in localedata.locale_identifiers():
-        assert numbers.format_currency(
-            1, 'USD', locale=locale_code, format_type='name').find('1') > -1
-        assert numbers.format_currency(
-            '1', 'USD', locale=locale_code, format_type='name').find('1') > -1
+@pytest.mark.all_locales
+def test_format_currency_long_display_name_all(locale):
+    assert numbers.format_currency(
+        1, 'USD', locale=locale, format_type='name').find('1') > -1
+    assert numbers.format_currency(
+        '1', 'USD', locale=locale, format_type='name').find('1') > -1
 
 
 def test_format_currency_long_display_name_custom_format():
@@ -632,6 +676,8 @@ def test_format_percent():
     assert numbers.format_percent(0.34, locale='en_US') == '34%'
     assert numbers.format_percent(0.34, locale='en_US', numbering_system="default") == '34%'
     assert numbers.format_percent(0, locale='en_US') == '0%'
+    assert numbers.format_percent(-0.29, locale='en_US') == '-29%'
+    assert numbers.format_percent(0.125, '#,##0.0%', locale='en_US') == '12.5%'
     assert numbers.format_percent(0.34, '##0%', locale='en_US') == '34%'
     assert numbers.format_percent(34, '##0', locale='en_US') == '34'
     assert numbers.format_percent(25.1234, locale='en_US') == '2,512%'
@@ -656,8 +702,6 @@ def test_format_percent():
     ('0.000000', '0%'),
     ('0', '0%'),
     ('0.00', '0%'),
-    ('0.01', '1%'),
-    ('0.011', '1.1%'),
     ('0.0110', '1.1%'),
     ('0.0001', '0.01%'),
     ('0.000100', '0.01%'),
@@ -670,11 +714,10 @@ def test_format_percent_precision(input_value, expected_value):
         decimal.Decimal(input_value), locale='en_US', decimal_quantization=False) == expected_value
 
 
-def test_format_percent_quantization():
-    # Test all locales.
-    for locale_code in localedata.locale_identifiers():
-        assert numbers.format_percent(
-            '0.9999999999', locale=locale_code, decimal_quantization=False).find('99999999') > -1
+@pytest.mark.all_locales
+def test_format_percent_quantization(locale):
+    assert numbers.format_percent(
+        '0.9999999999', locale=locale, decimal_quantization=False).find('99999999') > -1
 
 
 def test_format_scientific():
@@ -729,11 +772,10 @@ def test_format_scientific_precision(input_value, expected_value):
         decimal.Decimal(input_value), locale='en_US', decimal_quantization=False) == expected_value
 
 
-def test_format_scientific_quantization():
-    # Test all locales.
-    for locale_code in localedata.locale_identifiers():
-        assert numbers.format_scientific(
-            '0.9999999999', locale=locale_code, decimal_quantization=False).find('999999999') > -1
+@pytest.mark.all_locales
+def test_format_scientific_quantization(locale):
+    assert numbers.format_scientific(
+        '0.9999999999', locale=locale, decimal_quantization=False).find('999999999') > -1
 
 
 def test_parse_number():
@@ -781,6 +823,11 @@ def test_parse_grouping():
     assert numbers.parse_grouping('#,####,###') == (3, 4)
 
 
+def test_format_zero_width_grouping():
+    assert numbers.parse_grouping('#,') == (0, 0)
+    assert numbers.format_decimal(1234567, '#,', locale='en_US') == ',1234567'
+
+
 def test_parse_pattern():
 
     # Original pattern is preserved
@@ -791,12 +838,11 @@ def test_parse_pattern():
     assert np.pattern == '¤#,##0.00;(¤#,##0.00)'
 
     # Given a NumberPattern object, we don't return a new instance.
-    # However, we don't cache NumberPattern objects, so calling
-    # parse_pattern with the same format string will create new
-    # instances
+    # Parsed patterns are also cached, so calling parse_pattern with
+    # the same format string returns the same instance
     np1 = numbers.parse_pattern('¤ #,##0.00')
     np2 = numbers.parse_pattern('¤ #,##0.00')
-    assert np1 is not np2
+    assert np1 is np2
     assert np1 is numbers.parse_pattern(np1)
 
 
@@ -828,6 +874,18 @@ def test_numberpattern_repr():
     assert repr(format) in repr(np)
 
 
+def test_numberpattern_pickle():
+    np = numbers.parse_pattern('¤#,##0.00;(¤#,##0.00)')
+    np2 = pickle.loads(pickle.dumps(np))
+    assert np2.pattern == np.pattern
+    assert np2.prefix == np.prefix
+    assert np2.suffix == np.suffix
+    assert np2.grouping == np.grouping
+    assert np2.frac_prec == np.frac_prec
+    assert np2.scale == np.scale
+    assert np2.significant is np.significant is False
+
+
 def test_parse_static_pattern():
     assert numbers.parse_pattern('Kun')  # in the So locale in CLDR 30
     # TODO: static patterns might not be correctly `apply()`ed at present
@@ -80,6 +80,23 @@ def test_to_python():
     func = plural.to_python({'one': 'n in 1,11', 'few': 'n in 3..10,13..19'})
     assert func(11) == 'one'
     assert func(15) == 'few'
+    assert func(15.5) == 'other'
+    assert func(decimal.Decimal('11.0')) == 'one'
+
+
+def test_to_python_wide_range_is_not_expanded():
+    compile_python = plural._PythonCompiler().compile
+    assert compile_python(plural._Parser('n in 2..4').ast) == '(n in {2, 3, 4})'
+    assert compile_python(plural._Parser('n in 0..20000000').ast) == 'IN(n, [(0, 20000000)])'
+    rule = plural.PluralRule({'one': 'n in 0..20000000'})
+    assert rule(20000000) == 'one'
+    assert rule(20000001) == 'other'
+
+
+def test_to_python_reuses_compiled_rules():
+    rules = {'one': 'n is 1', 'few': 'n in 2..4'}
+    assert plural.to_python(rules) is plural.to_python(dict(rules))
+    assert plural.PluralRule(rules)(3) == 'few'
 
 
 def test_to_gettext():
@@ -109,6 +126,9 @@ def test_cldr_modulo():
     assert plural.cldr_modulo(-3, 5) == -3
     assert plural.cldr_modulo(-3, -5) == -3
     assert plural.cldr_modulo(3, 5) == 3
+    assert plural.cldr_modulo(3, -5) == 3
+    assert plural.cldr_modulo(-10, 5) == 0
+    assert plural.cldr_modulo(decimal.Decimal('-13'), 10) == -3
 
 
 def test_plural_within_rules():
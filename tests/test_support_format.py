@@ -6,12 +6,12 @@ import pytest
 from babel import support
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def ar_eg_format() -> support.Format:
     return support.Format('ar_EG', numbering_system="default")
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def en_us_format(timezone_getter) -> support.Format:
     return support.Format('en_US', tzinfo=timezone_getter('US/Eastern'))
 
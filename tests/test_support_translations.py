@@ -1,9 +1,7 @@
+import functools
 import inspect
 import io
-import os
-import shutil
 import sys
-import tempfile
 
 import pytest
 
@@ -34,8 +32,9 @@ def use_en_us_locale(monkeypatch):
     monkeypatch.setenv('LANG', 'en_US.UTF-8')
 
 
-@pytest.fixture()
-def translations() -> support.Translations:
+@pytest.fixture(scope='module')
+def mo_bytes():
+    # Compiling the catalogs is deterministic, so do it once per module.
     catalog1 = Catalog(locale='en_GB', domain='messages')
     catalog2 = Catalog(locale='en_GB', domain='messages1')
     for ids, kwargs in messages1:
@@ -45,28 +44,33 @@ def translations() -> support.Translations:
     catalog1_fp = io.BytesIO()
     catalog2_fp = io.BytesIO()
     write_mo(catalog1_fp, catalog1)
-    catalog1_fp.seek(0)
     write_mo(catalog2_fp, catalog2)
-    catalog2_fp.seek(0)
-    translations1 = support.Translations(catalog1_fp)
-    translations2 = support.Translations(catalog2_fp, domain='messages1')
+    return catalog1_fp.getvalue(), catalog2_fp.getvalue()
+
+
+@pytest.fixture()
+def translations(mo_bytes) -> support.Translations:
+    catalog1_bytes, catalog2_bytes = mo_bytes
+    translations1 = support.Translations(io.BytesIO(catalog1_bytes))
+    translations2 = support.Translations(io.BytesIO(catalog2_bytes), domain='messages1')
     return translations1.add(translations2, merge=False)
 
 
 @pytest.fixture(scope='module')
-def empty_translations() -> support.Translations:
+def empty_mo_bytes():
     fp = io.BytesIO()
     write_mo(fp, Catalog(locale='de'))
-    fp.seek(0)
-    return support.Translations(fp=fp)
+    return fp.getvalue()
 
 
 @pytest.fixture(scope='module')
-def null_translations() -> support.NullTranslations:
-    fp = io.BytesIO()
-    write_mo(fp, Catalog(locale='de'))
-    fp.seek(0)
-    return support.NullTranslations(fp=fp)
+def empty_translations(empty_mo_bytes) -> support.Translations:
+    return support.Translations(fp=io.BytesIO(empty_mo_bytes))
+
+
+@pytest.fixture(scope='module')
+def null_translations(empty_mo_bytes) -> support.NullTranslations:
+    return support.NullTranslations(fp=io.BytesIO(empty_mo_bytes))
 
 
 def assert_equal_type_too(expected, result) -> None:
@@ -76,10 +80,52 @@ def assert_equal_type_too(expected, result) -> None:
     )
 
 
-def test_pgettext(translations):
-    assert_equal_type_too('Voh', translations.gettext('foo'))
-    assert_equal_type_too('VohCTX', translations.pgettext('foo', 'foo'))
-    assert_equal_type_too('VohCTX1', translations.pgettext('foo', 'foo1'))
+_skip_lgettext = pytest.mark.skipif(SKIP_LGETTEXT, reason='lgettext is deprecated')
+
+GETTEXT_CASES = [
+    ('gettext', ('foo',), 'Voh'),
+    ('pgettext', ('foo', 'foo'), 'VohCTX'),
+    ('pgettext', ('foo', 'foo1'), 'VohCTX1'),
+    ('ugettext', ('foo',), 'Voh'),
+    ('upgettext', ('foo', 'foo'), 'VohCTX'),
+    pytest.param('lgettext', ('foo',), b'Voh', marks=_skip_lgettext),
+    pytest.param('lpgettext', ('foo', 'foo'), b'VohCTX', marks=_skip_lgettext),
+    ('ngettext', ('foo1', 'foos1', 1), 'Voh1'),
+    ('ngettext', ('foo1', 'foos1', 2), 'Vohs1'),
+    ('npgettext', ('foo', 'foo1', 'foos1', 1), 'VohCTX1'),
+    ('npgettext', ('foo', 'foo1', 'foos1', 2), 'VohsCTX1'),
+    ('ungettext', ('foo1', 'foos1', 1), 'Voh1'),
+    ('ungettext', ('foo1', 'foos1', 2), 'Vohs1'),
+    ('unpgettext', ('foo', 'foo1', 'foos1', 1), 'VohCTX1'),
+    ('unpgettext', ('foo', 'foo1', 'foos1', 2), 'VohsCTX1'),
+    pytest.param('lngettext', ('foo1', 'foos1', 1), b'Voh1', marks=_skip_lgettext),
+    pytest.param('lngettext', ('foo1', 'foos1', 2), b'Vohs1', marks=_skip_lgettext),
+    pytest.param('lnpgettext', ('foo', 'foo1', 'foos1', 1), b'VohCTX1', marks=_skip_lgettext),
+    pytest.param('lnpgettext', ('foo', 'foo1', 'foos1', 2), b'VohsCTX1', marks=_skip_lgettext),
+    ('dgettext', ('messages1', 'foo'), 'VohD'),
+    ('dpgettext', ('messages1', 'foo', 'foo'), 'VohCTXD'),
+    ('dugettext', ('messages1', 'foo'), 'VohD'),
+    ('dupgettext', ('messages1', 'foo', 'foo'), 'VohCTXD'),
+    pytest.param('ldgettext', ('messages1', 'foo'), b'VohD', marks=_skip_lgettext),
+    pytest.param('ldpgettext', ('messages1', 'foo', 'foo'), b'VohCTXD', marks=_skip_lgettext),
+    ('dngettext', ('messages1', 'foo1', 'foos1', 1), 'VohD1'),
+    ('dngettext', ('messages1', 'foo1', 'foos1', 2), 'VohsD1'),
+    ('dnpgettext', ('messages1', 'foo', 'foo1', 'foos1', 1), 'VohCTXD1'),
+    ('dnpgettext', ('messages1', 'foo', 'foo1', 'foos1', 2), 'VohsCTXD1'),
+    ('dungettext', ('messages1', 'foo1', 'foos1', 1), 'VohD1'),
+    ('dungettext', ('messages1', 'foo1', 'foos1', 2), 'VohsD1'),
+    ('dunpgettext', ('messages1', 'foo', 'foo1', 'foos1', 1), 'VohCTXD1'),
+    ('dunpgettext', ('messages1', 'foo', 'foo1', 'foos1', 2), 'VohsCTXD1'),
+    pytest.param('ldngettext', ('messages1', 'foo1', 'foos1', 1), b'VohD1', marks=_skip_lgettext),
+    pytest.param('ldngettext', ('messages1', 'foo1', 'foos1', 2), b'VohsD1', marks=_skip_lgettext),
+    pytest.param('ldnpgettext', ('messages1', 'foo', 'foo1', 'foos1', 1), b'VohCTXD1', marks=_skip_lgettext),
+    pytest.param('ldnpgettext', ('messages1', 'foo', 'foo1', 'foos1', 2), b'VohsCTXD1', marks=_skip_lgettext),
+]
+
+
+@pytest.mark.parametrize('name, args, expected', GETTEXT_CASES)
+def test_gettext_methods(translations, name, args, expected):
+    assert_equal_type_too(expected, getattr(translations, name)(*args))
 
 
 def test_pgettext_fallback(translations):
@@ -89,101 +135,36 @@ def test_pgettext_fallback(translations):
     translations._fallback = fallback
 
 
-def test_upgettext(translations):
-    assert_equal_type_too('Voh', translations.ugettext('foo'))
-    assert_equal_type_too('VohCTX', translations.upgettext('foo', 'foo'))
-
-
-@pytest.mark.skipif(SKIP_LGETTEXT, reason='lgettext is deprecated')
-def test_lpgettext(translations):
-    assert_equal_type_too(b'Voh', translations.lgettext('foo'))
-    assert_equal_type_too(b'VohCTX', translations.lpgettext('foo', 'foo'))
-
-
-def test_npgettext(translations):
-    assert_equal_type_too('Voh1', translations.ngettext('foo1', 'foos1', 1))
-    assert_equal_type_too('Vohs1', translations.ngettext('foo1', 'foos1', 2))
-    assert_equal_type_too('VohCTX1', translations.npgettext('foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsCTX1', translations.npgettext('foo', 'foo1', 'foos1', 2))
-
+def test_load(tmp_path):
+    messages_dir = tmp_path / 'fr' / 'LC_MESSAGES'
+    messages_dir.mkdir(parents=True)
+    catalog = Catalog(locale='fr', domain='messages')
+    catalog.add('foo', 'bar')
+    with open(messages_dir / 'messages.mo', 'wb') as f:
+        write_mo(f, catalog)
 
-def test_unpgettext(translations):
-    assert_equal_type_too('Voh1', translations.ungettext('foo1', 'foos1', 1))
-    assert_equal_type_too('Vohs1', translations.ungettext('foo1', 'foos1', 2))
-    assert_equal_type_too('VohCTX1', translations.unpgettext('foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsCTX1', translations.unpgettext('foo', 'foo1', 'foos1', 2))
+    translations = support.Translations.load(str(tmp_path), locales=('fr',), domain='messages')
+    assert translations.gettext('foo') == 'bar'
 
 
-@pytest.mark.skipif(SKIP_LGETTEXT, reason='lgettext is deprecated')
-def test_lnpgettext(translations):
-    assert_equal_type_too(b'Voh1', translations.lngettext('foo1', 'foos1', 1))
-    assert_equal_type_too(b'Vohs1', translations.lngettext('foo1', 'foos1', 2))
-    assert_equal_type_too(b'VohCTX1', translations.lnpgettext('foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too(b'VohsCTX1', translations.lnpgettext('foo', 'foo1', 'foos1', 2))
-
-
-def test_dpgettext(translations):
-    assert_equal_type_too('VohD', translations.dgettext('messages1', 'foo'))
-    assert_equal_type_too('VohCTXD', translations.dpgettext('messages1', 'foo', 'foo'))
-
-
-def test_dupgettext(translations):
-    assert_equal_type_too('VohD', translations.dugettext('messages1', 'foo'))
-    assert_equal_type_too('VohCTXD', translations.dupgettext('messages1', 'foo', 'foo'))
-
-
-@pytest.mark.skipif(SKIP_LGETTEXT, reason='lgettext is deprecated')
-def test_ldpgettext(translations):
-    assert_equal_type_too(b'VohD', translations.ldgettext('messages1', 'foo'))
-    assert_equal_type_too(b'VohCTXD', translations.ldpgettext('messages1', 'foo', 'foo'))
-
-
-def test_dnpgettext(translations):
-    assert_equal_type_too('VohD1', translations.dngettext('messages1', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsD1', translations.dngettext('messages1', 'foo1', 'foos1', 2))
-    assert_equal_type_too('VohCTXD1', translations.dnpgettext('messages1', 'foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsCTXD1', translations.dnpgettext('messages1', 'foo', 'foo1', 'foos1', 2))
-
-
-def test_dunpgettext(translations):
-    assert_equal_type_too('VohD1', translations.dungettext('messages1', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsD1', translations.dungettext('messages1', 'foo1', 'foos1', 2))
-    assert_equal_type_too('VohCTXD1', translations.dunpgettext('messages1', 'foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too('VohsCTXD1', translations.dunpgettext('messages1', 'foo', 'foo1', 'foos1', 2))
-
-
-@pytest.mark.skipif(SKIP_LGETTEXT, reason='lgettext is deprecated')
-def test_ldnpgettext(translations):
-    assert_equal_type_too(b'VohD1', translations.ldngettext('messages1', 'foo1', 'foos1', 1))
-    assert_equal_type_too(b'VohsD1', translations.ldngettext('messages1', 'foo1', 'foos1', 2))
-    assert_equal_type_too(b'VohCTXD1', translations.ldnpgettext('messages1', 'foo', 'foo1', 'foos1', 1))
-    assert_equal_type_too(b'VohsCTXD1', translations.ldnpgettext('messages1', 'foo', 'foo1', 'foos1', 2))
-
-
-def test_load(translations):
-    tempdir = tempfile.mkdtemp()
-    try:
-        messages_dir = os.path.join(tempdir, 'fr', 'LC_MESSAGES')
-        os.makedirs(messages_dir)
-        catalog = Catalog(locale='fr', domain='messages')
-        catalog.add('foo', 'bar')
-        with open(os.path.join(messages_dir, 'messages.mo'), 'wb') as f:
-            write_mo(f, catalog)
-
-        translations = support.Translations.load(tempdir, locales=('fr',), domain='messages')
-        assert translations.gettext('foo') == 'bar'
-    finally:
-        shutil.rmtree(tempdir)
+def get_gettext_method_names(obj):
+    return _get_gettext_method_names(type(obj))
 
 
-def get_gettext_method_names(obj):
-    names = [name for name in dir(obj) if 'gettext' in name]
+@functools.lru_cache(maxsize=None)
+def _get_gettext_method_names(cls):
+    names = [name for name in dir(cls) if 'gettext' in name]
     if SKIP_LGETTEXT:
         # Remove deprecated l*gettext functions
         names = [name for name in names if not name.startswith('l')]
     return names
 
 
+@functools.lru_cache(maxsize=None)
+def _get_argspec(func):
+    return inspect.getfullargspec(func)
+
+
 def test_null_translations_have_same_methods(empty_translations, null_translations):
     for name in get_gettext_method_names(empty_translations):
         assert hasattr(null_translations, name), f'NullTranslations does not provide method {name!r}'
@@ -192,8 +173,8 @@ def test_null_translations_have_same_methods(empty_translations, null_translatio
 def test_null_translations_method_signature_compatibility(empty_translations, null_translations):
     for name in get_gettext_method_names(empty_translations):
         assert (
-            inspect.getfullargspec(getattr(empty_translations, name)) ==
-            inspect.getfullargspec(getattr(null_translations, name))
+            _get_argspec(getattr(empty_translations, name).__func__) ==
+            _get_argspec(getattr(null_translations, name).__func__)
         )
 
 
@@ -212,7 +193,7 @@ def test_null_translations_same_return_values(empty_translations, null_translati
     for name in get_gettext_method_names(empty_translations):
         method = getattr(empty_translations, name)
         null_method = getattr(null_translations, name)
-        signature = inspect.getfullargspec(method)
+        signature = _get_argspec(method.__func__)
         parameter_names = [name for name in signature.args if name != 'self']
         values = [data[name] for name in parameter_names]
         assert method(*values) == null_method(*values)
@@ -12,7 +12,6 @@
 
 import __future__
 
-import unittest
 from io import BytesIO
 
 import pytest
@@ -31,6 +30,8 @@ class _FF:
 def test_distinct():
     assert list(util.distinct([1, 2, 1, 3, 4, 4])) == [1, 2, 3, 4]
     assert list(util.distinct('foobar')) == ['f', 'o', 'b', 'a', 'r']
+    items = [i % 997 for i in range(0, 30000, 7)]
+    assert list(util.distinct(items)) == list(dict.fromkeys(items))
 
 
 def test_pathmatch():
@@ -46,16 +47,13 @@ def test_pathmatch():
     assert not util.pathmatch('./foo/**.py', 'blah/foo/bar/baz.py')
 
 
-class FixedOffsetTimezoneTestCase(unittest.TestCase):
-
-    def test_zone_negative_offset(self):
-        assert util.FixedOffsetTimezone(-60).zone == 'Etc/GMT-60'
-
-    def test_zone_zero_offset(self):
-        assert util.FixedOffsetTimezone(0).zone == 'Etc/GMT+0'
-
-    def test_zone_positive_offset(self):
-        assert util.FixedOffsetTimezone(330).zone == 'Etc/GMT+330'
+@pytest.mark.parametrize('offset, zone', [
+    (-60, 'Etc/GMT-60'),
+    (0, 'Etc/GMT+0'),
+    (330, 'Etc/GMT+330'),
+])
+def test_fixed_offset_timezone_zone(offset, zone):
+    assert util.FixedOffsetTimezone(offset).zone == zone
 
 
 def parse_encoding(s):